@@ -0,0 +1,14 @@
+"""
+Optional dependencies shared by funcpipe modules.
+
+Each name is the imported module, or None when it is not installed.
+"""
+
+from types import ModuleType
+from typing import Optional
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
@@ -5,8 +5,10 @@ Provides a functional data processing pipeline through CLI commands.
 """
 
 import click
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Mapping, Tuple
 from pathlib import Path
+from types import MappingProxyType
+import operator
 import sys
 
 from . import Pipeline, filters, transforms, readers, writers
@@ -43,27 +45,15 @@ def inspect(input_file: str, output: str, format: str, sample: int, info: bool):
                 click.echo(f"Error: {file_info['error']}", err=True)
             return
         
-        # Read data
-        data = readers.auto_read(input_file)
-        
-        # Apply sample limit if specified
+        # Read data, stopping after the sample limit if specified
         if sample:
-            data = data[:sample]
+            data = readers.read_sample(input_file, sample)
+        else:
+            data = readers.auto_read(input_file)
         
         # Output results
         if output:
-            if format:
-                # Override auto-detection with specified format
-                if format == 'json':
-                    writers.write_json(data, output)
-                elif format == 'csv':
-                    writers.write_csv(data, output)
-                elif format == 'tsv':
-                    writers.write_tsv(data, output)
-                elif format == 'table':
-                    writers.write_pretty_table(data, output)
-            else:
-                writers.auto_write(data, output)
+            _write_output(data, output, format)
             click.echo(f"Data written to {output}")
         else:
             # Print to console
@@ -93,8 +83,8 @@ def process(input_file: str, filter_expr: List[str], map_expr: List[str],
            sort_expr: str, take: int, skip: int, output: str, format: str):
     """Process data through functional pipeline."""
     try:
-        # Read input data
-        data = readers.auto_read(input_file)
+        # Read input lazily; the pipeline consumes records as it runs
+        data = readers.iter_records(input_file)
         
         # Build pipeline
         pipeline = Pipeline()
@@ -127,17 +117,7 @@ def process(input_file: str, filter_expr: List[str], map_expr: List[str],
         
         # Output results
         if output:
-            if format:
-                if format == 'json':
-                    writers.write_json(result, output)
-                elif format == 'csv':
-                    writers.write_csv(result, output)
-                elif format == 'tsv':
-                    writers.write_tsv(result, output)
-                elif format == 'table':
-                    writers.write_pretty_table(result, output)
-            else:
-                writers.auto_write(result, output)
+            _write_output(result, output, format)
             click.echo(f"Processed {len(result)} records -> {output}")
         else:
             writers.print_sample(result, n=10)
@@ -183,13 +163,69 @@ def report(input_file: str, output_dir: str):
         sys.exit(1)
 
 
+# Writers for the --format option, shared by all commands that write data
+_FORMAT_WRITERS: Mapping[str, Callable[[List[Dict[str, Any]], str], None]] = MappingProxyType({
+    'json': writers.write_json,
+    'csv': writers.write_csv,
+    'tsv': writers.write_tsv,
+    'table': writers.write_pretty_table,
+})
+
+
+def _write_output(data: List[Dict[str, Any]], output: str, format: str) -> None:
+    """Write data in the given format, or auto-detect it from the file extension."""
+    if format:
+        _FORMAT_WRITERS[format](data, output)
+    else:
+        writers.auto_write(data, output)
+
+
+# Read-only dispatch tables for the expression parsers.
+# Comparison operators mapped to filter factories. Two-character operators
+# come first so ">=" is not mistaken for ">".
+_COMPARISON_FILTERS: Mapping[str, Callable[..., Callable[[Dict[str, Any]], Any]]] = MappingProxyType({
+    '>=': filters.greater_than_or_equal,
+    '<=': filters.less_than_or_equal,
+    '!=': lambda field, value: filters.not_filter(filters.equals(field, value)),
+    '==': filters.equals,
+    '>': filters.greater_than,
+    '<': filters.less_than,
+})
+
+# Map operations that only take a field name
+_FIELD_TRANSFORMS: Mapping[str, Callable[..., Callable[[Dict[str, Any]], Any]]] = MappingProxyType({
+    'capitalize': transforms.capitalize_field,
+    'upper': transforms.upper_field,
+    'lower': transforms.lower_field,
+    'strip': transforms.strip_field,
+    'remove': transforms.remove_field,
+})
+
+# Map operations that take a field name and one numeric parameter
+_NUMERIC_TRANSFORMS: Mapping[str, Tuple[Callable[..., Callable[[Dict[str, Any]], Any]], Callable[[str], Any]]] = MappingProxyType({
+    'multiply': (transforms.multiply_field, float),
+    'add': (transforms.add_to_field, float),
+    'round': (transforms.round_field, int),
+})
+
+# Target types accepted by "cast:field:type"
+_CAST_TYPES = MappingProxyType({
+    'int': int,
+    'float': float,
+    'str': str,
+})
+
+# Path separators replaced in field values used as split filenames
+_FILENAME_SANITIZER = str.maketrans({'/': '_', '\\': '_'})
+
+
 def _parse_filter_expression(expr: str):
     """Parse filter expression into filter function."""
     # Simple parser for common filter patterns
     # Format: "field operator value"
     
     # Handle comparison operators
-    for op in ['>=', '<=', '!=', '==', '>', '<']:
+    for op, make_filter in _COMPARISON_FILTERS.items():
         if op in expr:
             field, value = expr.split(op, 1)
             field = field.strip()
@@ -204,18 +240,7 @@ def _parse_filter_expression(expr: str):
             except ValueError:
                 pass  # Keep as string
             
-            if op == '==':
-                return filters.equals(field, value)
-            elif op == '!=':
-                return filters.not_filter(filters.equals(field, value))
-            elif op == '>':
-                return filters.greater_than(field, value)
-            elif op == '>=':
-                return filters.greater_than_or_equal(field, value)
-            elif op == '<':
-                return filters.less_than(field, value)
-            elif op == '<=':
-                return filters.less_than_or_equal(field, value)
+            return make_filter(field, value)
     
     # Handle contains
     if ' contains ' in expr:
@@ -256,35 +281,16 @@ def _parse_map_expression(expr: str):
     
     field = parts[1].strip()
     
-    if operation == 'capitalize':
-        return transforms.capitalize_field(field)
-    elif operation == 'upper':
-        return transforms.upper_field(field)
-    elif operation == 'lower':
-        return transforms.lower_field(field)
-    elif operation == 'strip':
-        return transforms.strip_field(field)
-    elif operation == 'remove':
-        return transforms.remove_field(field)
-    elif operation == 'multiply' and len(parts) >= 3:
-        factor = float(parts[2])
-        return transforms.multiply_field(field, factor)
-    elif operation == 'add' and len(parts) >= 3:
-        value = float(parts[2])
-        return transforms.add_to_field(field, value)
-    elif operation == 'round' and len(parts) >= 3:
-        decimals = int(parts[2])
-        return transforms.round_field(field, decimals)
+    if operation in _FIELD_TRANSFORMS:
+        return _FIELD_TRANSFORMS[operation](field)
+    elif operation in _NUMERIC_TRANSFORMS and len(parts) >= 3:
+        make_transform, convert = _NUMERIC_TRANSFORMS[operation]
+        return make_transform(field, convert(parts[2]))
     elif operation == 'cast' and len(parts) >= 3:
         type_name = parts[2].lower()
-        if type_name == 'int':
-            return transforms.cast_field(field, int)
-        elif type_name == 'float':
-            return transforms.cast_field(field, float)
-        elif type_name == 'str':
-            return transforms.cast_field(field, str)
-        else:
+        if type_name not in _CAST_TYPES:
             raise ValueError(f"Unsupported cast type: {type_name}")
+        return transforms.cast_field(field, _CAST_TYPES[type_name])
     elif operation == 'replace' and len(parts) >= 4:
         old_val = parts[2]
         new_val = parts[3]
@@ -299,10 +305,8 @@ def _parse_sort_expression(expr: str):
     field = parts[0].strip()
     reverse = len(parts) > 1 and parts[1].strip().lower() in ['desc', 'descending']
     
-    def key_func(item):
-        return item.get(field)
-    
-    return key_func, reverse
+    # Equivalent to item.get(field), but called in C for every item sorted
+    return operator.methodcaller('get', field), reverse
 
 
 @cli.command()
@@ -321,15 +325,7 @@ def merge(input_files: List[str], output: str, format: str):
             click.echo(f"Loaded {len(data)} records from {file_path}")
         
         # Write merged data
-        if format:
-            if format == 'json':
-                writers.write_json(all_data, output)
-            elif format == 'csv':
-                writers.write_csv(all_data, output)
-            elif format == 'tsv':
-                writers.write_tsv(all_data, output)
-        else:
-            writers.auto_write(all_data, output)
+        _write_output(all_data, output, format)
         
         click.echo(f"Merged {len(all_data)} total records -> {output}")
         
@@ -367,16 +363,11 @@ def split(input_file: str, field_name: str, output_dir: str, format: str):
         
         for value, group_data in groups.items():
             # Sanitize filename
-            safe_value = str(value).replace('/', '_').replace('\\', '_')
+            safe_value = str(value).translate(_FILENAME_SANITIZER)
             filename = f"{input_name}_{field_name}_{safe_value}{ext}"
             filepath = output_path / filename
             
-            if format == 'json' or (not format and ext == '.json'):
-                writers.write_json(group_data, str(filepath))
-            elif format == 'csv' or (not format and ext == '.csv'):
-                writers.write_csv(group_data, str(filepath))
-            elif format == 'tsv' or (not format and ext == '.tsv'):
-                writers.write_tsv(group_data, str(filepath))
+            _write_output(group_data, str(filepath), format or 'json')
             
             click.echo(f"{value}: {len(group_data)} records -> {filename}")
         
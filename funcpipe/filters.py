@@ -234,14 +234,15 @@ def between(field: str, min_val: Union[int, float], max_val: Union[int, float],
     Returns:
         Predicate function
     """
-    def predicate(item: Dict[str, Any]) -> bool:
-        field_value = item.get(field)
-        if field_value is None:
-            return False
-        
-        if inclusive:
-            return min_val <= field_value <= max_val
-        return min_val < field_value < max_val
+    # Pick the comparison once instead of branching on every item
+    if inclusive:
+        def predicate(item: Dict[str, Any]) -> bool:
+            field_value = item.get(field)
+            return field_value is not None and min_val <= field_value <= max_val
+    else:
+        def predicate(item: Dict[str, Any]) -> bool:
+            field_value = item.get(field)
+            return field_value is not None and min_val < field_value < max_val
     
     predicate.__name__ = f"between_{field}_{min_val}_{max_val}"
     return predicate
@@ -2,8 +2,9 @@
 Core Pipeline implementation using functional composition.
 """
 
-from typing import List, Dict, Any, Callable, Optional
+from typing import List, Dict, Any, Callable, Iterable, Optional, Protocol, Sequence, Tuple, cast
 from functools import reduce
+from itertools import chain, groupby, islice
 import copy
 
 
@@ -15,13 +16,16 @@ class Pipeline:
     Supports method chaining for readable data transformation workflows.
     """
     
-    def __init__(self, operations: Optional[List[Callable]] = None):
-        """Initialize pipeline with optional list of operations."""
-        self._operations = operations or []
+    __slots__ = ('_operations', '_fused')
+    
+    def __init__(self, operations: Optional[Sequence[Callable]] = None):
+        """Initialize pipeline with optional sequence of operations."""
+        self._operations = tuple(operations) if operations else ()
+        self._fused: Optional[Tuple[Callable, ...]] = None  # Built on first run, then reused
     
     def _add_operation(self, operation: Callable) -> 'Pipeline':
         """Create new pipeline with additional operation (immutable)."""
-        return Pipeline(self._operations + [operation])
+        return Pipeline(self._operations + (operation,))
     
     def filter(self, predicate: Callable[[Dict[str, Any]], bool]) -> 'Pipeline':
         """
@@ -33,10 +37,7 @@ class Pipeline:
         Returns:
             New Pipeline with filter operation added
         """
-        def filter_op(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-            return [item for item in data if predicate(item)]
-        
-        return self._add_operation(filter_op)
+        return self._add_operation(_make_filter_op((predicate,)))
     
     def map(self, transform: Callable[[Dict[str, Any]], Dict[str, Any]]) -> 'Pipeline':
         """
@@ -48,10 +49,7 @@ class Pipeline:
         Returns:
             New Pipeline with map operation added
         """
-        def map_op(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-            return [transform(copy.deepcopy(item)) for item in data]
-        
-        return self._add_operation(map_op)
+        return self._add_operation(_make_map_op((transform,)))
     
     def reduce(self, reducer: Callable, initial_value: Any = None) -> 'Pipeline':
         """
@@ -97,8 +95,12 @@ class Pipeline:
         Returns:
             New Pipeline with take operation added
         """
-        def take_op(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-            return data[:n]
+        def take_op(data: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            if isinstance(data, list):
+                return data[:n]
+            if n < 0:
+                return list(data)[:n]  # Counting from the end needs all input
+            return list(islice(data, n))  # Stop pulling from lazy input early
         
         return self._add_operation(take_op)
     
@@ -112,22 +114,52 @@ class Pipeline:
         Returns:
             New Pipeline with skip operation added
         """
-        def skip_op(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-            return data[n:]
+        def skip_op(data: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            if isinstance(data, list):
+                return data[n:]
+            if n < 0:
+                return list(data)[n:]
+            return list(islice(data, n, None))
         
         return self._add_operation(skip_op)
     
-    def run(self, data: List[Dict[str, Any]]) -> Any:
+    def run(self, data: Iterable[Dict[str, Any]]) -> Any:
         """
         Execute the pipeline on input data.
         
         Args:
-            data: Input data to process
+            data: Input data to process, either a list or any iterable of
+                records (e.g. readers.iter_records) consumed lazily by the
+                first operation
             
         Returns:
             Transformed data after applying all operations
         """
-        return reduce(lambda acc, op: op(acc), self._operations, data)
+        if not self._operations and not isinstance(data, list):
+            return list(data)
+        return reduce(lambda acc, op: op(acc), self._fused_operations(), data)
+    
+    def _fused_operations(self) -> Tuple[Callable, ...]:
+        """
+        Merge runs of adjacent filter or map operations into single passes.
+        
+        Chained filters then scan the data once instead of once each,
+        with predicates still applied in order and short-circuiting.
+        Chained maps apply every transform to an item before moving on,
+        without building a list between steps. The result is computed once
+        per pipeline and reused by every run.
+        """
+        if self._fused is None:
+            fused: List[Callable] = []
+            for attr, operations in groupby(self._operations, key=_fusible_attribute):
+                group = list(operations)
+                if attr is None or len(group) == 1:
+                    fused.extend(group)
+                else:
+                    steps = tuple(chain.from_iterable(getattr(op, attr) for op in group))
+                    fused.append(_FUSIBLE_OPERATIONS[attr](steps))
+            self._fused = tuple(fused)
+        return self._fused
     
     def __len__(self) -> int:
         """Return number of operations in pipeline."""
@@ -139,6 +171,79 @@ class Pipeline:
         return f"Pipeline({len(self._operations)} operations: {' → '.join(op_names)})"
 
 
+class _FilterOperation(Protocol):
+    """Filter operation that keeps the predicates it was built from."""
+    
+    __name__: str
+    predicates: Tuple[Callable[[Dict[str, Any]], bool], ...]
+    
+    def __call__(self, data: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]: ...
+
+
+class _MapOperation(Protocol):
+    """Map operation that keeps the transforms it was built from."""
+    
+    __name__: str
+    transforms: Tuple[Callable[[Dict[str, Any]], Dict[str, Any]], ...]
+    
+    def __call__(self, data: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]: ...
+
+
+def _make_filter_op(predicates: Tuple[Callable[[Dict[str, Any]], bool], ...]) -> _FilterOperation:
+    """Create filter operation keeping items that satisfy every predicate."""
+    if len(predicates) == 1:
+        predicate = predicates[0]
+    else:
+        def predicate(item: Dict[str, Any]) -> bool:
+            for check in predicates:
+                if not check(item):
+                    return False
+            return True
+    
+    def filter_op(data: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [item for item in data if predicate(item)]
+    
+    operation = cast(_FilterOperation, filter_op)
+    operation.predicates = predicates
+    return operation
+
+
+def _make_map_op(transforms: Tuple[Callable[[Dict[str, Any]], Dict[str, Any]], ...]) -> _MapOperation:
+    """Create map operation applying each transform in turn to a copy of every item."""
+    if len(transforms) == 1:
+        transform = transforms[0]
+        
+        def map_op(data: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            return [transform(copy.deepcopy(item)) for item in data]
+    else:
+        def map_op(data: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            result = []
+            for item in data:
+                for transform in transforms:
+                    item = transform(copy.deepcopy(item))
+                result.append(item)
+            return result
+    
+    operation = cast(_MapOperation, map_op)
+    operation.transforms = transforms
+    return operation
+
+
+# Operation attributes holding fusible steps, with the factory that rebuilds them
+_FUSIBLE_OPERATIONS: Dict[str, Callable[[Tuple[Callable, ...]], Callable]] = {
+    'predicates': _make_filter_op,
+    'transforms': _make_map_op,
+}
+
+
+def _fusible_attribute(op: Callable) -> Optional[str]:
+    """Return the attribute holding an operation's fusible steps, if any."""
+    for attr in _FUSIBLE_OPERATIONS:
+        if hasattr(op, attr):
+            return attr
+    return None
+
+
 def compose(*functions: Callable) -> Callable:
     """
     Compose multiple functions into a single function.
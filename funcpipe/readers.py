@@ -4,11 +4,18 @@ Data readers for various file formats.
 Pure functional approach to reading data from files.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Callable, Generator, Iterable, Iterator, Optional
+from functools import partial
+from itertools import islice
+from contextlib import closing
 import json
 import csv
+import re
+import sys
 from pathlib import Path
 
+from ._compat import orjson
+
 
 def read_json(filepath: str) -> List[Dict[str, Any]]:
     """
@@ -29,8 +36,8 @@ def read_json(filepath: str) -> List[Dict[str, Any]]:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
     
-    with open(path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(path, 'rb') as f:
+        data = _loads_json(f.read())
     
     # Ensure we return a list of dicts
     if isinstance(data, dict):
@@ -41,6 +48,30 @@ def read_json(filepath: str) -> List[Dict[str, Any]]:
         raise ValueError("JSON must contain object or array of objects")
 
 
+# Digit runs long enough to overflow a 64-bit integer, which orjson would
+# parse as a float instead of an int
+_WIDE_INTEGER = re.compile(rb'\d{19}')
+
+
+def _loads_json(raw: bytes) -> Any:
+    """
+    Parse JSON bytes, using orjson when it is installed.
+    
+    Falls back to the standard library for input orjson rejects or would
+    parse differently (NaN, integers wider than 64 bits), so the result
+    and errors match json.loads on the UTF-8 decoded text.
+    """
+    if orjson is not None and not _WIDE_INTEGER.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    
+    # Decode strictly, as a UTF-8 text read would; json.loads(bytes) would
+    # also accept a BOM and UTF-16/32
+    return json.loads(raw.decode('utf-8'))
+
+
 def read_csv(filepath: str, delimiter: str = ',', 
              has_header: bool = True) -> List[Dict[str, Any]]:
     """
@@ -57,35 +88,53 @@ def read_csv(filepath: str, delimiter: str = ',',
     Raises:
         FileNotFoundError: If file doesn't exist
     """
+    return list(iter_csv(filepath, delimiter, has_header))
+
+
+def iter_csv(filepath: str, delimiter: str = ',',
+             has_header: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily read CSV file one record at a time.
+    
+    Args:
+        filepath: Path to CSV file
+        delimiter: Field delimiter
+        has_header: Whether first row contains headers
+        
+    Yields:
+        Dictionaries with numeric strings converted
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist (on first iteration)
+    """
     path = Path(filepath)
     
     if not path.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
     
-    data = []
-    
     with open(path, 'r', encoding='utf-8', newline='') as f:
         if has_header:
             reader = csv.DictReader(f, delimiter=delimiter)
+            if reader.fieldnames:
+                # Interned keys match field-name literals by identity on lookup
+                reader.fieldnames = [sys.intern(name) for name in reader.fieldnames]
             for row in reader:
                 # Convert numeric strings to numbers where possible
                 converted_row = {}
                 for key, value in row.items():
                     converted_row[key] = _try_convert_numeric(value)
-                data.append(converted_row)
+                yield converted_row
         else:
-            reader = csv.reader(f, delimiter=delimiter)
-            headers = [f"column_{i}" for i in range(len(next(reader, [])))]
+            row_reader = csv.reader(f, delimiter=delimiter)
+            headers = [sys.intern(f"column_{i}") for i in range(len(next(row_reader, [])))]
             f.seek(0)  # Reset to beginning
             
-            for row in reader:
+            for values in row_reader:
                 converted_row = {}
-                for i, value in enumerate(row):
+                for i, value in enumerate(values):
                     if i < len(headers):
                         converted_row[headers[i]] = _try_convert_numeric(value)
-                data.append(converted_row)
-    
-    return data
+                yield converted_row
 
 
 def read_tsv(filepath: str, has_header: bool = True) -> List[Dict[str, Any]]:
@@ -113,25 +162,50 @@ def read_text_lines(filepath: str, strip_empty: bool = True) -> List[Dict[str, A
     Returns:
         List of dictionaries with 'line' field
     """
+    return list(iter_text_lines(filepath, strip_empty))
+
+
+def iter_text_lines(filepath: str, strip_empty: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily read text file one line at a time.
+    
+    Args:
+        filepath: Path to text file
+        strip_empty: Whether to skip empty lines
+        
+    Yields:
+        Dictionaries with 'line_number' and 'line' fields
+    """
     path = Path(filepath)
     
     if not path.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
     
     with open(path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    data = []
-    for i, line in enumerate(lines):
-        line = line.rstrip('\n\r')
-        if strip_empty and not line.strip():
-            continue
-        data.append({
-            'line_number': i + 1,
-            'line': line
-        })
-    
-    return data
+        for i, line in enumerate(f):
+            line = line.rstrip('\n\r')
+            if strip_empty and not line.strip():
+                continue
+            yield {
+                'line_number': i + 1,
+                'line': line
+            }
+
+
+# Readers for each supported file extension, used for format auto-detection
+_READERS: Dict[str, Callable[[str], List[Dict[str, Any]]]] = {
+    '.json': read_json,
+    '.csv': read_csv,
+    '.tsv': read_tsv,
+    '.txt': read_text_lines,
+}
+
+_RECORD_ITERATORS: Dict[str, Callable[[str], Iterable[Dict[str, Any]]]] = {
+    '.json': read_json,  # JSON must be parsed in full either way
+    '.csv': iter_csv,
+    '.tsv': partial(iter_csv, delimiter='\t'),
+    '.txt': iter_text_lines,
+}
 
 
 def auto_read(filepath: str) -> List[Dict[str, Any]]:
@@ -147,19 +221,35 @@ def auto_read(filepath: str) -> List[Dict[str, Any]]:
     Raises:
         ValueError: If file format not supported
     """
-    path = Path(filepath)
-    suffix = path.suffix.lower()
-    
-    if suffix == '.json':
-        return read_json(filepath)
-    elif suffix == '.csv':
-        return read_csv(filepath)
-    elif suffix == '.tsv':
-        return read_tsv(filepath)
-    elif suffix == '.txt':
-        return read_text_lines(filepath)
-    else:
+    suffix = Path(filepath).suffix.lower()
+    
+    if suffix not in _READERS:
+        raise ValueError(f"Unsupported file format: {suffix}")
+    return _READERS[suffix](filepath)
+
+
+def iter_records(filepath: str) -> Generator[Dict[str, Any], None, None]:
+    """
+    Automatically detect file format and lazily yield records.
+    
+    CSV, TSV and text files are parsed incrementally, so consumers that
+    stop early (e.g. sampling) avoid reading the whole file. JSON has to
+    be parsed in full before the first record is available.
+    
+    Args:
+        filepath: Path to data file
+        
+    Yields:
+        Dictionaries, one per record
+        
+    Raises:
+        ValueError: If file format not supported
+    """
+    suffix = Path(filepath).suffix.lower()
+    
+    if suffix not in _RECORD_ITERATORS:
         raise ValueError(f"Unsupported file format: {suffix}")
+    yield from _RECORD_ITERATORS[suffix](filepath)
 
 
 def _try_convert_numeric(value: str) -> Any:
@@ -172,7 +262,17 @@ def _try_convert_numeric(value: str) -> Any:
     Returns:
         Converted value (int, float, or original string)
     """
-    if not isinstance(value, str) or not value.strip():
+    if not isinstance(value, str):
+        return value
+    
+    stripped = value.strip()
+    if not stripped:
+        return value
+    
+    # Most text values can't be numbers; skip the exception-raising
+    # conversions unless the value starts like int() or float() input
+    first = stripped[0]
+    if not (first.isdecimal() or first in '+-.' or stripped[:3].lower() in ('inf', 'nan')):
         return value
     
     # Try integer conversion first
@@ -197,13 +297,15 @@ def read_sample(filepath: str, n: int = 5) -> List[Dict[str, Any]]:
     
     Args:
         filepath: Path to data file
-        n: Number of records to read
+        n: Number of records to read (negative counts from the end, as
+            in slicing)
         
     Returns:
         List of dictionaries (up to n items)
     """
-    data = auto_read(filepath)
-    return data[:n]
+    if n < 0:
+        return auto_read(filepath)[:n]
+    return list(islice(iter_records(filepath), n))
 
 
 def get_file_info(filepath: str) -> Dict[str, Any]:
@@ -221,25 +323,26 @@ def get_file_info(filepath: str) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
     
-    info = {
+    size_bytes = path.stat().st_size
+    info: Dict[str, Any] = {
         'filename': path.name,
-        'size_bytes': path.stat().st_size,
+        'size_bytes': size_bytes,
         'format': path.suffix.lower(),
     }
     
-    # Try to get record count and field names
+    # Get field names and record count in a single pass over the file
     try:
-        sample = read_sample(filepath, 1)
-        if sample:
-            info['fields'] = list(sample[0].keys())
-            info['field_count'] = len(sample[0])
-        
-        # For small files, get exact count
-        if info['size_bytes'] < 1024 * 1024:  # 1MB
-            full_data = auto_read(filepath)
-            info['record_count'] = len(full_data)
-        else:
-            info['record_count'] = 'large_file'
+        with closing(iter_records(filepath)) as records:
+            first = next(records, None)
+            if first is not None:
+                info['fields'] = list(first.keys())
+                info['field_count'] = len(first)
+            
+            # For small files, get exact count
+            if size_bytes < 1024 * 1024:  # 1MB
+                info['record_count'] = (first is not None) + sum(1 for _ in records)
+            else:
+                info['record_count'] = 'large_file'
             
     except Exception as e:
         info['error'] = str(e)
@@ -3,6 +3,12 @@ Functional transforms for data processing pipelines.
 
 All transforms are pure functions that return new data structures.
 Supports currying and composition for flexible data transformations.
+
+Built-in transforms only replace top-level values, so a shallow copy of
+each record keeps the input unchanged. Nested values they don't replace
+(lists, dicts) are shared between input and output records; Pipeline.map
+deep-copies each record first, so pipelines never alias their input.
+Transforms that run user-supplied functions deep-copy instead.
 """
 
 from typing import Any, Callable, Dict, List, Union
@@ -24,7 +30,7 @@ def add_field(field_name: str, value: Any) -> Callable[[Dict[str, Any]], Dict[st
         Transform function
     """
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = dict(item)
         result[field_name] = value
         return result
     
@@ -43,7 +49,7 @@ def remove_field(field_name: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
         Transform function
     """
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = dict(item)
         result.pop(field_name, None)
         return result
     
@@ -63,7 +69,7 @@ def rename_field(old_name: str, new_name: str) -> Callable[[Dict[str, Any]], Dic
         Transform function
     """
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = dict(item)
         if old_name in result:
             result[new_name] = result.pop(old_name)
         return result
@@ -83,7 +89,7 @@ def capitalize_field(field_name: str) -> Callable[[Dict[str, Any]], Dict[str, An
         Transform function
     """
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = dict(item)
         if field_name in result and isinstance(result[field_name], str):
             result[field_name] = result[field_name].capitalize()
         return result
@@ -95,7 +101,7 @@ def capitalize_field(field_name: str) -> Callable[[Dict[str, Any]], Dict[str, An
 def upper_field(field_name: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
     """Create transform to uppercase a string field."""
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = dict(item)
         if field_name in result and isinstance(result[field_name], str):
             result[field_name] = result[field_name].upper()
         return result
@@ -107,7 +113,7 @@ def upper_field(field_name: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
 def lower_field(field_name: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
     """Create transform to lowercase a string field."""
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = dict(item)
         if field_name in result and isinstance(result[field_name], str):
             result[field_name] = result[field_name].lower()
         return result
@@ -128,7 +134,7 @@ def strip_field(field_name: str, chars: str = None) -> Callable[[Dict[str, Any]]
         Transform function
     """
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = dict(item)
         if field_name in result and isinstance(result[field_name], str):
             result[field_name] = result[field_name].strip(chars)
         return result
@@ -151,14 +157,15 @@ def replace_in_field(field_name: str, old: str, new: str,
     Returns:
         Transform function
     """
+    # Compile the case-insensitive pattern once, not per item
+    pattern = None if case_sensitive else re.compile(re.escape(old), re.IGNORECASE)
+    
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = dict(item)
         if field_name in result and isinstance(result[field_name], str):
-            if case_sensitive:
+            if pattern is None:
                 result[field_name] = result[field_name].replace(old, new)
             else:
-                # Case-insensitive replace using regex
-                pattern = re.compile(re.escape(old), re.IGNORECASE)
                 result[field_name] = pattern.sub(new, result[field_name])
         return result
     
@@ -178,7 +185,7 @@ def multiply_field(field_name: str, factor: Union[int, float]) -> Callable[[Dict
         Transform function
     """
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = dict(item)
         if field_name in result and isinstance(result[field_name], (int, float)):
             result[field_name] = result[field_name] * factor
         return result
@@ -190,7 +197,7 @@ def multiply_field(field_name: str, factor: Union[int, float]) -> Callable[[Dict
 def add_to_field(field_name: str, value: Union[int, float]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
     """Create transform to add value to numeric field."""
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = dict(item)
         if field_name in result and isinstance(result[field_name], (int, float)):
             result[field_name] = result[field_name] + value
         return result
@@ -211,7 +218,7 @@ def round_field(field_name: str, decimals: int = 0) -> Callable[[Dict[str, Any]]
         Transform function
     """
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = dict(item)
         if field_name in result and isinstance(result[field_name], (int, float)):
             result[field_name] = round(result[field_name], decimals)
         return result
@@ -235,7 +242,7 @@ def compute_field(field_name: str, computation: Callable[[Dict[str, Any]], Any])
         >>> full_name = compute_field('full_name', lambda item: f"{item['first']} {item['last']}")
     """
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = copy.deepcopy(item)  # User code may mutate nested values
         result[field_name] = computation(result)
         return result
     
@@ -255,7 +262,7 @@ def format_field(field_name: str, format_str: str) -> Callable[[Dict[str, Any]],
         Transform function
     """
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = dict(item)
         if field_name in result:
             try:
                 result[field_name] = format_str.format(result[field_name])
@@ -267,6 +274,10 @@ def format_field(field_name: str, format_str: str) -> Callable[[Dict[str, Any]],
     return transform
 
 
+# Types whose values can be shared between records without copying
+_IMMUTABLE_TYPES = frozenset({int, float, str, bool, bytes, tuple, frozenset})
+
+
 def cast_field(field_name: str, target_type: type) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
     """
     Create transform to cast field to different type.
@@ -278,9 +289,13 @@ def cast_field(field_name: str, target_type: type) -> Callable[[Dict[str, Any]],
     Returns:
         Transform function
     """
+    # Immutable values already of the target type need no conversion;
+    # containers are always converted so the result gets its own copy
+    skip_matching = target_type in _IMMUTABLE_TYPES
+    
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
-        if field_name in result:
+        result = dict(item)
+        if field_name in result and not (skip_matching and type(result[field_name]) is target_type):
             try:
                 result[field_name] = target_type(result[field_name])
             except (ValueError, TypeError):
@@ -308,7 +323,7 @@ def extract_regex_field(source_field: str, target_field: str, pattern: str,
     compiled_pattern = re.compile(pattern)
     
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = dict(item)
         if source_field in result and isinstance(result[source_field], str):
             match = compiled_pattern.search(result[source_field])
             if match:
@@ -333,7 +348,7 @@ def split_field(source_field: str, target_fields: List[str],
         Transform function
     """
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = dict(item)
         if source_field in result and isinstance(result[source_field], str):
             parts = result[source_field].split(separator)
             for i, field_name in enumerate(target_fields):
@@ -356,7 +371,7 @@ def apply_function(field_name: str, func: Callable[[Any], Any]) -> Callable[[Dic
         Transform function
     """
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = copy.deepcopy(item)  # User code may mutate nested values
         if field_name in result:
             try:
                 result[field_name] = func(result[field_name])
@@ -444,7 +459,7 @@ def add_tax(price_field: str, tax_field: str, tax_rate: float) -> Callable[[Dict
         Transform function
     """
     def transform(item: Dict[str, Any]) -> Dict[str, Any]:
-        result = copy.deepcopy(item)
+        result = dict(item)
         if price_field in result and isinstance(result[price_field], (int, float)):
             tax_amount = result[price_field] * tax_rate
             result[tax_field] = round(tax_amount, 2)
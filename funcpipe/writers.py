@@ -4,11 +4,14 @@ Data writers for various output formats.
 Pure functional approach to writing processed data.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Callable, Optional, Set, TypedDict
 import json
 import csv
+import math
 from pathlib import Path
 
+from ._compat import orjson
+
 
 def write_json(data: List[Dict[str, Any]], filepath: str, indent: int = 2) -> None:
     """
@@ -20,10 +23,74 @@ def write_json(data: List[Dict[str, Any]], filepath: str, indent: int = 2) -> No
         indent: JSON indentation level
     """
     path = Path(filepath)
-    path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+    with _open_output(path, 'wb') as f:
+        f.write(dumps_json(data, indent))
+
+
+def _open_output(path: Path, mode: str, **kwargs):
+    """
+    Open an output file, creating its parent directory only when missing.
+    
+    The common case of an existing directory costs a single open() call
+    instead of an extra mkdir() on every write.
+    """
+    try:
+        return open(path, mode, **kwargs)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return open(path, mode, **kwargs)
+
+
+def dumps_json(data: Any, indent: Optional[int] = 2) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON bytes.
+    
+    Uses orjson when it is installed, the indent is 2 (the only layout it
+    shares with json.dumps) and the data is plain JSON, falling back to the
+    standard library otherwise so output never depends on whether orjson
+    is installed.
+    
+    Args:
+        data: Data to serialize
+        indent: JSON indentation level (None for compact output)
+        
+    Returns:
+        JSON document as UTF-8 bytes
+    """
+    if orjson is not None and indent == 2 and _is_plain_json(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # Fall back for integers wider than 64 bits
+    
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8')
+
+
+# Scalar types orjson and the standard library encode identically
+_PLAIN_JSON_SCALARS = frozenset({str, int, bool, type(None)})
+
+
+def _is_plain_json(value: Any) -> bool:
+    """
+    Check that value holds only JSON types orjson encodes like json.dumps.
+    
+    Non-finite floats (written as null by orjson but NaN/Infinity by the
+    standard library), floats in exponent notation (1e16 rather than
+    1e+16, 0.00001 rather than 1e-05), non-string keys, subclasses and
+    other objects such as datetimes are rejected.
+    """
+    value_type = type(value)
+    if value_type is float:
+        return math.isfinite(value) and 'e' not in repr(value)
+    if value_type in _PLAIN_JSON_SCALARS:
+        return True
+    if value_type is dict:
+        return (all(type(key) is str for key in value)
+                and all(_is_plain_json(item) for item in value.values()))
+    if value_type is list or value_type is tuple:
+        return all(_is_plain_json(item) for item in value)
+    return False
 
 
 def write_csv(data: List[Dict[str, Any]], filepath: str, 
@@ -40,7 +107,6 @@ def write_csv(data: List[Dict[str, Any]], filepath: str,
         return
     
     path = Path(filepath)
-    path.parent.mkdir(parents=True, exist_ok=True)
     
     # Get all unique field names from all records
     fieldnames = set()
@@ -48,7 +114,7 @@ def write_csv(data: List[Dict[str, Any]], filepath: str,
         fieldnames.update(item.keys())
     fieldnames = sorted(list(fieldnames))
     
-    with open(path, 'w', encoding='utf-8', newline='') as f:
+    with _open_output(path, 'w', encoding='utf-8', newline='') as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=delimiter)
         writer.writeheader()
         writer.writerows(data)
@@ -76,12 +142,9 @@ def write_text_lines(data: List[Dict[str, Any]], filepath: str,
         line_field: Field containing line content
     """
     path = Path(filepath)
-    path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(path, 'w', encoding='utf-8') as f:
-        for item in data:
-            line = str(item.get(line_field, ''))
-            f.write(line + '\n')
+    with _open_output(path, 'w', encoding='utf-8') as f:
+        f.writelines(f"{item.get(line_field, '')}\n" for item in data)
 
 
 def write_pretty_table(data: List[Dict[str, Any]], filepath: str,
@@ -98,7 +161,6 @@ def write_pretty_table(data: List[Dict[str, Any]], filepath: str,
         return
     
     path = Path(filepath)
-    path.parent.mkdir(parents=True, exist_ok=True)
     
     # Get all field names
     fieldnames = set()
@@ -114,7 +176,7 @@ def write_pretty_table(data: List[Dict[str, Any]], filepath: str,
             max(len(str(item.get(field, ''))) for item in data)
         ))
     
-    with open(path, 'w', encoding='utf-8') as f:
+    with _open_output(path, 'w', encoding='utf-8') as f:
         # Write header
         header_row = ' | '.join(field.ljust(widths[field]) for field in fieldnames)
         f.write(header_row + '\n')
@@ -123,13 +185,23 @@ def write_pretty_table(data: List[Dict[str, Any]], filepath: str,
         separator = '-+-'.join('-' * widths[field] for field in fieldnames)
         f.write(separator + '\n')
         
-        # Write data rows
-        for item in data:
-            row = ' | '.join(
+        # Write data rows in one batched call
+        f.writelines(
+            ' | '.join(
                 str(item.get(field, '')).ljust(widths[field])[:widths[field]]
                 for field in fieldnames
-            )
-            f.write(row + '\n')
+            ) + '\n'
+            for item in data
+        )
+
+
+# Writers for each supported file extension, used for format auto-detection
+_WRITERS: Dict[str, Callable[[List[Dict[str, Any]], str], None]] = {
+    '.json': write_json,
+    '.csv': write_csv,
+    '.tsv': write_tsv,
+    '.txt': write_text_lines,
+}
 
 
 def auto_write(data: List[Dict[str, Any]], filepath: str) -> None:
@@ -143,19 +215,11 @@ def auto_write(data: List[Dict[str, Any]], filepath: str) -> None:
     Raises:
         ValueError: If file format not supported
     """
-    path = Path(filepath)
-    suffix = path.suffix.lower()
-    
-    if suffix == '.json':
-        write_json(data, filepath)
-    elif suffix == '.csv':
-        write_csv(data, filepath)
-    elif suffix == '.tsv':
-        write_tsv(data, filepath)
-    elif suffix == '.txt':
-        write_text_lines(data, filepath)
-    else:
+    suffix = Path(filepath).suffix.lower()
+    
+    if suffix not in _WRITERS:
         raise ValueError(f"Unsupported output format: {suffix}")
+    _WRITERS[suffix](data, filepath)
 
 
 def print_sample(data: List[Dict[str, Any]], n: int = 5) -> None:
@@ -192,20 +256,7 @@ def print_summary(data: List[Dict[str, Any]]) -> None:
         return
     
     # Get all field names and types
-    field_info = {}
-    for item in data:
-        for key, value in item.items():
-            if key not in field_info:
-                field_info[key] = {
-                    'count': 0,
-                    'null_count': 0,
-                    'types': set()
-                }
-            
-            field_info[key]['count'] += 1
-            if value is None or value == '':
-                field_info[key]['null_count'] += 1
-            field_info[key]['types'].add(type(value).__name__)
+    field_info = _analyze_fields(data)
     
     print(f"Dataset Summary:")
     print(f"Records: {len(data)}")
@@ -221,6 +272,50 @@ def print_summary(data: List[Dict[str, Any]]) -> None:
         print()
 
 
+class _FieldStats(TypedDict):
+    """Statistics collected for one field by _analyze_fields."""
+    
+    count: int
+    null_count: int
+    types: Set[str]
+    sample_values: List[str]
+
+
+def _analyze_fields(data: List[Dict[str, Any]], sample_size: int = 0) -> Dict[str, _FieldStats]:
+    """
+    Collect per-field counts, null counts, types and sample values in one pass.
+    
+    Args:
+        data: List of dictionaries to analyze
+        sample_size: Number of sample values to keep per field
+        
+    Returns:
+        Dictionary mapping field name to its statistics
+    """
+    field_info: Dict[str, _FieldStats] = {}
+    for item in data:
+        for key, value in item.items():
+            info = field_info.get(key)
+            if info is None:
+                info = field_info[key] = {
+                    'count': 0,
+                    'null_count': 0,
+                    'types': set(),
+                    'sample_values': []
+                }
+            
+            info['count'] += 1
+            if value is None or value == '':
+                info['null_count'] += 1
+            info['types'].add(type(value).__name__)
+            
+            # Collect sample values
+            if len(info['sample_values']) < sample_size:
+                info['sample_values'].append(str(value)[:50])
+    
+    return field_info
+
+
 def write_report(data: List[Dict[str, Any]], filepath: str, 
                 include_sample: bool = True, sample_size: int = 10) -> None:
     """
@@ -233,9 +328,8 @@ def write_report(data: List[Dict[str, Any]], filepath: str,
         sample_size: Number of sample records to include
     """
     path = Path(filepath)
-    path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(path, 'w', encoding='utf-8') as f:
+    with _open_output(path, 'w', encoding='utf-8') as f:
         # Write header
         f.write("Data Processing Report\n")
         f.write("=" * 50 + "\n\n")
@@ -248,25 +342,7 @@ def write_report(data: List[Dict[str, Any]], filepath: str,
             return
         
         # Field analysis
-        field_info = {}
-        for item in data:
-            for key, value in item.items():
-                if key not in field_info:
-                    field_info[key] = {
-                        'count': 0,
-                        'null_count': 0,
-                        'types': set(),
-                        'sample_values': []
-                    }
-                
-                field_info[key]['count'] += 1
-                if value is None or value == '':
-                    field_info[key]['null_count'] += 1
-                field_info[key]['types'].add(type(value).__name__)
-                
-                # Collect sample values
-                if len(field_info[key]['sample_values']) < 3:
-                    field_info[key]['sample_values'].append(str(value)[:50])
+        field_info = _analyze_fields(data, sample_size=3)
         
         f.write(f"Total Fields: {len(field_info)}\n\n")
         
@@ -5,14 +5,11 @@ Interactive web interface for building data processing pipelines visually.
 """
 
 import streamlit as st
-import sys
-import os
-from pathlib import Path
 
-# Add the parent directory to the path so we can import funcpipe
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from funcpipe_ui.utils.session_state import initialize_session_state
+from funcpipe_ui.utils.session_state import (
+    initialize_session_state, clear_pipeline, get_uploaded_data, get_pipeline_operations,
+    set_pipeline_results, get_field_names
+)
 from funcpipe_ui.components.file_loader import render_file_uploader, render_example_data_selector
 from funcpipe_ui.components.pipeline_builder import render_pipeline_builder, execute_pipeline
 from funcpipe_ui.components.data_preview import render_data_preview
@@ -104,13 +101,10 @@ def render_sidebar():
         
         # Clear pipeline button
         if st.button("🗑️ Clear Pipeline", key="clear_pipeline"):
-            from funcpipe_ui.utils.session_state import clear_pipeline
             clear_pipeline()
             st.rerun()
         
         # Run pipeline button
-        from funcpipe_ui.utils.session_state import get_uploaded_data, get_pipeline_operations, set_pipeline_results
-        
         uploaded_data = get_uploaded_data()
         operations = get_pipeline_operations()
         
@@ -140,13 +134,11 @@ def render_sidebar():
         
         # Status
         st.subheader("📊 Status")
-        uploaded_data = get_uploaded_data()
         if uploaded_data:
             st.success(f"✅ Data loaded: {len(uploaded_data)} records")
         else:
             st.info("📤 No data loaded")
         
-        operations = get_pipeline_operations()
         if operations:
             st.success(f"✅ Pipeline: {len(operations)} operations")
         else:
@@ -157,7 +149,6 @@ def render_main_content():
     """Render the main content area."""
     
     # Check if data is loaded
-    from funcpipe_ui.utils.session_state import get_uploaded_data
     uploaded_data = get_uploaded_data()
     
     if not uploaded_data:
@@ -220,7 +211,6 @@ def render_pipeline_builder_tab():
     st.header("🔧 Pipeline Builder")
     
     # Show current data info
-    from funcpipe_ui.utils.session_state import get_uploaded_data, get_field_names
     uploaded_data = get_uploaded_data()
     field_names = get_field_names()
     
@@ -10,8 +10,8 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from typing import List, Dict, Any, Optional
-from ..utils.session_state import get_uploaded_data, get_current_data
-from .pipeline_builder import execute_pipeline
+from ..utils.session_state import get_uploaded_data, get_current_data, get_pipeline_operations
+from .pipeline_builder import execute_pipeline, build_pipeline, operations_key
 
 
 def render_data_preview() -> None:
@@ -87,7 +87,6 @@ def _render_stage_by_stage_tab(data: List[Dict[str, Any]]) -> None:
         return
     
     # Get pipeline operations
-    from ..utils.session_state import get_pipeline_operations
     operations = get_pipeline_operations()
     
     if not operations:
@@ -95,23 +94,20 @@ def _render_stage_by_stage_tab(data: List[Dict[str, Any]]) -> None:
         return
     
     # Execute pipeline step by step
-    current_data = data
-    stages = [{"name": "Original Data", "data": current_data}]
+    stage_results = _get_stage_results(data, operations)
+    stages = [{"name": "Original Data", "data": data}]
     
     for i, operation in enumerate(operations):
-        # Execute up to this point
-        pipeline = _create_pipeline_up_to_stage(i)
-        current_data = pipeline.run(data)
-        
         stage_name = f"Step {i+1}: {operation.get('description', operation.get('type', 'Unknown'))}"
-        stages.append({"name": stage_name, "data": current_data})
+        stages.append({"name": stage_name, "data": stage_results[i]})
     
     # Display each stage
     for i, stage in enumerate(stages):
         with st.expander(f"{stage['name']} ({len(stage['data'])} records)", expanded=(i == len(stages)-1)):
             if stage['data']:
-                df = pd.DataFrame(stage['data'])
-                st.dataframe(df.head(10), use_container_width=True)
+                columns = list(dict.fromkeys(key for item in stage['data'] for key in item))
+                df = pd.DataFrame(stage['data'][:10], columns=columns)
+                st.dataframe(df, use_container_width=True)
                 
                 # Show changes from previous stage
                 if i > 0:
@@ -137,7 +133,7 @@ def _render_statistics_tab(data: List[Dict[str, Any]]) -> None:
     # Field statistics
     st.write("**Field Statistics:**")
     
-    field_stats = _calculate_field_statistics(current_data)
+    field_stats = _get_field_statistics(current_data)
     
     for field, stats in field_stats.items():
         with st.expander(f"📋 {field}", expanded=False):
@@ -273,6 +269,29 @@ def _render_quick_visualization(data: List[Dict[str, Any]]) -> None:
                 st.plotly_chart(fig, use_container_width=True)
 
 
+def _get_stage_results(data: List[Dict[str, Any]], operations: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """
+    Get the output of each pipeline stage, reusing results from the last rerun.
+    
+    Each stage runs only its own operation on the previous stage's output,
+    rather than re-running the whole pipeline prefix from the original data.
+    """
+    key = operations_key(operations)
+    cached = st.session_state.get('stage_results_cache')
+    if key is not None and cached is not None and cached[0] is data and cached[1] == key:
+        return cached[2]
+    
+    results = []
+    current_data = data
+    for i in range(len(operations)):
+        current_data = build_pipeline(operations[i:i + 1]).run(current_data)
+        results.append(current_data)
+    
+    if key is not None:
+        st.session_state.stage_results_cache = (data, key, results)
+    return results
+
+
 def _calculate_stage_changes(prev_data: List[Dict[str, Any]], current_data: List[Dict[str, Any]]) -> List[str]:
     """Calculate changes between two data stages."""
     changes = []
@@ -298,6 +317,15 @@ def _calculate_stage_changes(prev_data: List[Dict[str, Any]], current_data: List
     return changes
 
 
+def _get_field_statistics(data: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Get field statistics, recalculating only when the processed data changes."""
+    cached = st.session_state.get('field_stats_cache')
+    if cached is None or cached[0] is not data:
+        cached = (data, _calculate_field_statistics(data))
+        st.session_state.field_stats_cache = cached
+    return cached[1]
+
+
 def _calculate_field_statistics(data: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     """Calculate statistics for each field."""
     if not data:
@@ -429,39 +457,3 @@ def _find_duplicates(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             seen.add(item_tuple)
     
     return duplicates
-
-
-def _create_pipeline_up_to_stage(stage_index: int):
-    """Create pipeline that executes up to the specified stage."""
-    from funcpipe import Pipeline, filters, transforms
-    from ..utils.session_state import get_pipeline_operations
-    
-    pipeline = Pipeline()
-    operations = get_pipeline_operations()
-    
-    for i in range(min(stage_index + 1, len(operations))):
-        operation = operations[i]
-        
-        if operation["type"] == "filter":
-            from .pipeline_builder import _create_filter_function
-            filter_func = _create_filter_function(operation["config"])
-            pipeline = pipeline.filter(filter_func)
-            
-        elif operation["type"] == "transform":
-            from .pipeline_builder import _create_transform_function
-            transform_func = _create_transform_function(operation["config"])
-            pipeline = pipeline.map(transform_func)
-            
-        elif operation["type"] == "sort":
-            config = operation["config"]
-            key_func = lambda item: item.get(config["field"])
-            pipeline = pipeline.sort(key_func, config["reverse"])
-            
-        elif operation["type"] == "limit":
-            config = operation["config"]
-            if config["operation"] == "take":
-                pipeline = pipeline.take(config["value"])
-            elif config["operation"] == "skip":
-                pipeline = pipeline.skip(config["value"])
-    
-    return pipeline
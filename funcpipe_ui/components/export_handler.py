@@ -6,10 +6,15 @@ from the current pipeline configuration.
 """
 
 import streamlit as st
+import copy
+import csv
+import functools
 import json
 import io
+import os
 from typing import List, Dict, Any, Optional
-from ..utils.session_state import get_current_data, get_pipeline_operations, get_uploaded_data
+from ..utils.session_state import get_current_data, get_pipeline_operations, get_uploaded_data, clear_pipeline
+from funcpipe.writers import dumps_json
 
 
 def render_export_handler() -> None:
@@ -181,9 +186,9 @@ def _render_save_pipeline_tab() -> None:
                 st.rerun()
 
 
-def _convert_to_json(data: List[Dict[str, Any]]) -> str:
-    """Convert data to JSON string."""
-    return json.dumps(data, indent=2, ensure_ascii=False)
+def _convert_to_json(data: List[Dict[str, Any]]) -> bytes:
+    """Convert data to UTF-8 encoded JSON, using orjson when available."""
+    return dumps_json(data, indent=2)
 
 
 def _convert_to_csv(data: List[Dict[str, Any]]) -> str:
@@ -191,9 +196,6 @@ def _convert_to_csv(data: List[Dict[str, Any]]) -> str:
     if not data:
         return ""
     
-    import csv
-    import io
-    
     # Get all field names
     fieldnames = set()
     for item in data:
@@ -214,9 +216,6 @@ def _convert_to_tsv(data: List[Dict[str, Any]]) -> str:
     if not data:
         return ""
     
-    import csv
-    import io
-    
     # Get all field names
     fieldnames = set()
     for item in data:
@@ -232,18 +231,37 @@ def _convert_to_tsv(data: List[Dict[str, Any]]) -> str:
     return output.getvalue()
 
 
+# Static parts of the generated script, built once at import
+_CODE_HEADER = (
+    '#!/usr/bin/env python3',
+    '"""',
+    'Generated FuncPipe Pipeline',
+    'This script was generated by FuncPipe Web UI',
+    '"""',
+    '',
+    'from funcpipe import Pipeline, filters, transforms, readers, writers',
+    '',
+)
+
+_CODE_FOOTER = (
+    '',
+    '# Execute pipeline',
+    'result = pipeline.run(data)',
+    '',
+    '# Display results',
+    'print(f"Processed {len(result)} records")',
+    'writers.print_sample(result, n=5)',
+    '',
+    '# Save results',
+    '# writers.write_json(result, "output.json")',
+    '# writers.write_csv(result, "output.csv")',
+    '',
+)
+
+
 def _generate_python_code(operations: List[Dict[str, Any]], uploaded_data: Optional[List[Dict[str, Any]]]) -> str:
     """Generate Python code from pipeline operations."""
-    lines = [
-        '#!/usr/bin/env python3',
-        '"""',
-        'Generated FuncPipe Pipeline',
-        'This script was generated by FuncPipe Web UI',
-        '"""',
-        '',
-        'from funcpipe import Pipeline, filters, transforms, readers, writers',
-        '',
-    ]
+    lines = list(_CODE_HEADER)
     
     # Add data loading if we have uploaded data
     if uploaded_data:
@@ -289,20 +307,7 @@ def _generate_python_code(operations: List[Dict[str, Any]], uploaded_data: Optio
         elif operation["type"] == "limit":
             lines.append(_generate_limit_code(operation))
     
-    lines.extend([
-        '',
-        '# Execute pipeline',
-        'result = pipeline.run(data)',
-        '',
-        '# Display results',
-        'print(f"Processed {len(result)} records")',
-        'writers.print_sample(result, n=5)',
-        '',
-        '# Save results',
-        '# writers.write_json(result, "output.json")',
-        '# writers.write_csv(result, "output.csv")',
-        '',
-    ])
+    lines.extend(_CODE_FOOTER)
     
     return '\n'.join(lines)
 
@@ -398,14 +403,12 @@ def _generate_limit_code(operation: Dict[str, Any]) -> str:
 
 def _load_pipeline_config(config_data: Dict[str, Any]) -> None:
     """Load pipeline configuration from JSON data."""
-    from ..utils.session_state import clear_pipeline
-    
     # Clear current pipeline
     clear_pipeline()
     
-    # Load operations
+    # Load operations (copied so edits never touch the cached examples)
     if "operations" in config_data:
-        st.session_state.pipeline_operations = config_data["operations"]
+        st.session_state.pipeline_operations = copy.deepcopy(config_data["operations"])
     
     # Store metadata
     if "metadata" in config_data:
@@ -413,14 +416,24 @@ def _load_pipeline_config(config_data: Dict[str, Any]) -> None:
 
 
 def _load_example_pipelines() -> List[Dict[str, Any]]:
-    """Load example pipelines from JSON file."""
+    """Load example pipelines, or an empty list if they can't be read."""
     try:
-        import os
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        example_file = os.path.join(current_dir, "..", "example_pipelines.json")
-        
-        with open(example_file, 'r') as f:
-            data = json.load(f)
-            return data.get("example_pipelines", [])
+        return _read_example_pipelines()
     except Exception:
         return []
+
+
+@functools.lru_cache(maxsize=None)
+def _read_example_pipelines() -> List[Dict[str, Any]]:
+    """
+    Read example pipelines from the bundled JSON file.
+    
+    Only successful reads are cached (once per process); errors propagate
+    so a transient failure is retried on the next call.
+    """
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    example_file = os.path.join(current_dir, "..", "example_pipelines.json")
+    
+    with open(example_file, 'r') as f:
+        data = json.load(f)
+        return data.get("example_pipelines", [])
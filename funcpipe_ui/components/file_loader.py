@@ -6,10 +6,11 @@ Handles file upload, format detection, and initial data preview.
 
 import streamlit as st
 import pandas as pd
+import hashlib
 import json
 import io
 from typing import List, Dict, Any, Optional
-from .utils.session_state import set_uploaded_data, get_uploaded_data, get_field_names
+from ..utils.session_state import set_uploaded_data, get_uploaded_data, get_field_names, get_data_source
 
 
 def render_file_uploader() -> Optional[List[Dict[str, Any]]]:
@@ -29,17 +30,24 @@ def render_file_uploader() -> Optional[List[Dict[str, Any]]]:
     
     if uploaded_file is not None:
         try:
-            # Read file based on extension
-            if uploaded_file.name.endswith('.csv'):
-                data = _read_csv_file(uploaded_file)
-            elif uploaded_file.name.endswith('.json'):
-                data = _read_json_file(uploaded_file)
-            else:
-                st.error("Unsupported file format. Please upload CSV or JSON.")
-                return None
+            # The uploader returns the same file on every rerun; only parse
+            # it (and reset the pipeline) when its content actually changes
+            source = _get_upload_digest(uploaded_file)
             
-            # Store in session state
-            set_uploaded_data(data)
+            if source == get_data_source():
+                data = get_uploaded_data()
+            else:
+                # Read file based on extension
+                if uploaded_file.name.endswith('.csv'):
+                    data = _read_csv_file(uploaded_file)
+                elif uploaded_file.name.endswith('.json'):
+                    data = _read_json_file(uploaded_file)
+                else:
+                    st.error("Unsupported file format. Please upload CSV or JSON.")
+                    return None
+                
+                # Store in session state
+                set_uploaded_data(data, source)
             
             # Display file info and preview
             _display_file_info(uploaded_file, data)
@@ -54,6 +62,24 @@ def render_file_uploader() -> Optional[List[Dict[str, Any]]]:
     return None
 
 
+def _get_upload_digest(uploaded_file) -> str:
+    """
+    Return the SHA-256 digest of an upload's content.
+    
+    The digest is cached against the upload's file_id and size, so the
+    file is only hashed when a different file is uploaded rather than on
+    every rerun.
+    """
+    upload_key = (uploaded_file.file_id, uploaded_file.size)
+    cached = st.session_state.get('upload_digest')
+    
+    if cached is None or cached[0] != upload_key:
+        cached = (upload_key, hashlib.sha256(uploaded_file.getvalue()).hexdigest())
+        st.session_state.upload_digest = cached
+    
+    return cached[1]
+
+
 def _read_csv_file(uploaded_file) -> List[Dict[str, Any]]:
     """Read CSV file and return list of dictionaries."""
     # Read as pandas DataFrame first
@@ -62,9 +88,17 @@ def _read_csv_file(uploaded_file) -> List[Dict[str, Any]]:
     # Convert to list of dictionaries
     data = df.to_dict('records')
     
-    # Convert numeric strings to numbers where possible
+    # Convert numeric strings to numbers where possible. pandas has already
+    # parsed columns it could type, so only non-numeric columns (object or
+    # string dtype, depending on the pandas version) need checking.
+    text_columns = [column for column in df.columns
+                    if not pd.api.types.is_numeric_dtype(df[column])]
+    if not text_columns:
+        return data
+    
     for item in data:
-        for key, value in item.items():
+        for key in text_columns:
+            value = item[key]
             if isinstance(value, str) and value.strip():
                 # Try to convert to int first
                 try:
@@ -109,7 +143,7 @@ def _display_file_info(uploaded_file, data: List[Dict[str, Any]]) -> None:
         st.metric("Fields", len(data[0].keys()) if data else 0)
     
     with col3:
-        file_size = len(uploaded_file.getvalue())
+        file_size = uploaded_file.size
         st.metric("Size", f"{file_size:,} bytes")
     
     with col4:
@@ -128,11 +162,11 @@ def _display_data_preview(data: List[Dict[str, Any]], max_rows: int = 5) -> None
     field_names = list(data[0].keys())
     st.write(f"**Fields:** {', '.join(field_names)}")
     
-    # Create DataFrame for display
-    df = pd.DataFrame(data)
-    
-    # Display first few rows
-    st.dataframe(df.head(max_rows), use_container_width=True)
+    # Build the DataFrame from the displayed rows only, keeping columns
+    # that first appear in later records
+    columns = list(dict.fromkeys(key for item in data for key in item))
+    df = pd.DataFrame(data[:max_rows], columns=columns)
+    st.dataframe(df, use_container_width=True)
     
     # Show data types
     st.write("**Data Types:**")
@@ -155,10 +189,11 @@ def render_example_data_selector() -> Optional[List[Dict[str, Any]]]:
     """
     st.subheader("📋 Load Example Data")
     
+    # Map names to factories so only the selected dataset is built
     examples = {
-        "Employee Data": _get_employee_example(),
-        "Product Data": _get_product_example(),
-        "Sales Data": _get_sales_example()
+        "Employee Data": _get_employee_example,
+        "Product Data": _get_product_example,
+        "Sales Data": _get_sales_example
     }
     
     selected_example = st.selectbox(
@@ -167,8 +202,12 @@ def render_example_data_selector() -> Optional[List[Dict[str, Any]]]:
     )
     
     if selected_example != "None":
-        data = examples[selected_example]
-        set_uploaded_data(data)
+        source = f"example:{selected_example}"
+        if source == get_data_source():
+            data = get_uploaded_data()
+        else:
+            data = examples[selected_example]()
+            set_uploaded_data(data, source)
         
         st.success(f"✅ Loaded example: {selected_example}")
         _display_data_preview(data)
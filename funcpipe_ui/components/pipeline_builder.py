@@ -5,6 +5,9 @@ Provides interactive interface for building data processing pipelines
 with visual operation selection and configuration.
 """
 
+import functools
+import json
+import operator
 import streamlit as st
 from typing import List, Dict, Any, Optional, Callable
 from ..utils.session_state import (
@@ -15,6 +18,33 @@ from ..utils.session_state import (
 # Import funcpipe components
 from funcpipe import Pipeline, filters, transforms
 
+# Static options offered by the operation forms
+_OPERATION_TYPES = ("Filter", "Transform", "Sort", "Limit")
+
+_FILTER_TYPES = (
+    "equals", "greater_than", "greater_than_or_equal", "less_than",
+    "less_than_or_equal", "contains", "starts_with", "ends_with",
+    "is_null", "is_not_null", "between", "in_list",
+)
+
+_TRANSFORM_TYPES = (
+    "capitalize_field", "upper_field", "lower_field", "strip_field",
+    "add_field", "remove_field", "rename_field", "multiply_field",
+    "add_to_field", "round_field", "compute_field",
+)
+
+_LIMIT_TYPES = ("take", "skip")
+
+# Operation types grouped by the inputs their forms need
+_COMPARISON_FILTER_TYPES = frozenset({
+    "equals", "greater_than", "greater_than_or_equal", "less_than", "less_than_or_equal",
+})
+_TEXT_FILTER_TYPES = frozenset({"contains", "starts_with", "ends_with"})
+_FIELD_TRANSFORM_TYPES = frozenset({
+    "capitalize_field", "upper_field", "lower_field", "strip_field", "remove_field",
+})
+_NUMERIC_TRANSFORM_TYPES = frozenset({"multiply_field", "add_to_field", "round_field"})
+
 
 def render_pipeline_builder() -> List[Dict[str, Any]]:
     """
@@ -73,7 +103,7 @@ def _render_add_operation_form() -> None:
     
     operation_type = st.selectbox(
         "Operation Type:",
-        ["Filter", "Transform", "Sort", "Limit"],
+        _OPERATION_TYPES,
         key="new_operation_type"
     )
     
@@ -100,9 +130,7 @@ def _render_filter_form() -> None:
     with col1:
         filter_type = st.selectbox(
             "Filter Type:",
-            ["equals", "greater_than", "greater_than_or_equal", "less_than", 
-             "less_than_or_equal", "contains", "starts_with", "ends_with", 
-             "is_null", "is_not_null", "between", "in_list"],
+            _FILTER_TYPES,
             key="filter_type"
         )
         
@@ -115,11 +143,11 @@ def _render_filter_form() -> None:
     with col2:
         config = {"field": field, "filter_type": filter_type}
         
-        if filter_type in ["equals", "greater_than", "greater_than_or_equal", "less_than", "less_than_or_equal"]:
+        if filter_type in _COMPARISON_FILTER_TYPES:
             value = _get_filter_value_input(field, filter_type)
             config["value"] = value
             
-        elif filter_type in ["contains", "starts_with", "ends_with"]:
+        elif filter_type in _TEXT_FILTER_TYPES:
             value = st.text_input("Value:", key="filter_value")
             config["value"] = value
             
@@ -138,7 +166,7 @@ def _render_filter_form() -> None:
                 placeholder="value1\nvalue2\nvalue3",
                 key="filter_list"
             )
-            config["values"] = [v.strip() for v in values_text.split('\n') if v.strip()]
+            config["values"] = [v for v in map(str.strip, values_text.splitlines()) if v]
     
     if st.button("Add Filter", key="add_filter"):
         operation = {
@@ -164,20 +192,18 @@ def _render_transform_form() -> None:
     with col1:
         transform_type = st.selectbox(
             "Transform Type:",
-            ["capitalize_field", "upper_field", "lower_field", "strip_field",
-             "add_field", "remove_field", "rename_field", "multiply_field",
-             "add_to_field", "round_field", "compute_field"],
+            _TRANSFORM_TYPES,
             key="transform_type"
         )
     
     with col2:
         config = {"transform_type": transform_type}
         
-        if transform_type in ["capitalize_field", "upper_field", "lower_field", "strip_field", "remove_field"]:
+        if transform_type in _FIELD_TRANSFORM_TYPES:
             field = st.selectbox("Field:", field_names, key="transform_field")
             config["field"] = field
             
-        elif transform_type in ["add_field"]:
+        elif transform_type == "add_field":
             field_name = st.text_input("New Field Name:", key="new_field_name")
             value = st.text_input("Value:", key="new_field_value")
             config["field_name"] = field_name
@@ -189,7 +215,7 @@ def _render_transform_form() -> None:
             config["old_field"] = old_field
             config["new_field"] = new_field
             
-        elif transform_type in ["multiply_field", "add_to_field", "round_field"]:
+        elif transform_type in _NUMERIC_TRANSFORM_TYPES:
             field = st.selectbox("Field:", field_names, key="transform_field")
             if transform_type == "round_field":
                 decimals = st.number_input("Decimal Places:", min_value=0, max_value=10, value=0, key="decimals")
@@ -253,7 +279,7 @@ def _render_limit_form() -> None:
     """Render limit operation form."""
     operation_subtype = st.selectbox(
         "Limit Type:",
-        ["take", "skip"],
+        _LIMIT_TYPES,
         key="limit_type"
     )
     
@@ -286,94 +312,60 @@ def _get_filter_value_input(field: str, filter_type: str) -> Any:
         return st.text_input("Value:", key="filter_value")
 
 
+# Description templates, filled in from the operation config
+_FILTER_DESCRIPTIONS = {
+    "equals": "Keep records where {field} = {value}",
+    "greater_than": "Keep records where {field} > {value}",
+    "greater_than_or_equal": "Keep records where {field} >= {value}",
+    "less_than": "Keep records where {field} < {value}",
+    "less_than_or_equal": "Keep records where {field} <= {value}",
+    "contains": "Keep records where {field} contains '{value}'",
+    "starts_with": "Keep records where {field} starts with '{value}'",
+    "ends_with": "Keep records where {field} ends with '{value}'",
+    "is_null": "Keep records where {field} is null",
+    "is_not_null": "Keep records where {field} is not null",
+    "between": "Keep records where {field} is between {min_value} and {max_value}",
+    "in_list": "Keep records where {field} is in [{values}]",
+}
+
+_TRANSFORM_DESCRIPTIONS = {
+    "capitalize_field": "Capitalize {field}",
+    "upper_field": "Convert {field} to uppercase",
+    "lower_field": "Convert {field} to lowercase",
+    "strip_field": "Strip whitespace from {field}",
+    "add_field": "Add field '{field_name}' with value '{value}'",
+    "remove_field": "Remove field {field}",
+    "rename_field": "Rename {old_field} to {new_field}",
+    "multiply_field": "Multiply {field} by {value}",
+    "add_to_field": "Add {value} to {field}",
+    "round_field": "Round {field} to {decimals} decimal places",
+    "compute_field": "Compute new field '{field_name}'",
+}
+
+
+class _DescriptionFields(dict):
+    """Config mapping that renders missing keys as empty strings."""
+    
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
 def _get_filter_description(config: Dict[str, Any]) -> str:
     """Generate human-readable description for filter operation."""
-    field = config.get("field", "")
-    filter_type = config.get("filter_type", "")
-    
-    if filter_type == "equals":
-        value = config.get("value", "")
-        return f"Keep records where {field} = {value}"
-    elif filter_type == "greater_than":
-        value = config.get("value", "")
-        return f"Keep records where {field} > {value}"
-    elif filter_type == "greater_than_or_equal":
-        value = config.get("value", "")
-        return f"Keep records where {field} >= {value}"
-    elif filter_type == "less_than":
-        value = config.get("value", "")
-        return f"Keep records where {field} < {value}"
-    elif filter_type == "less_than_or_equal":
-        value = config.get("value", "")
-        return f"Keep records where {field} <= {value}"
-    elif filter_type == "contains":
-        value = config.get("value", "")
-        return f"Keep records where {field} contains '{value}'"
-    elif filter_type == "starts_with":
-        value = config.get("value", "")
-        return f"Keep records where {field} starts with '{value}'"
-    elif filter_type == "ends_with":
-        value = config.get("value", "")
-        return f"Keep records where {field} ends with '{value}'"
-    elif filter_type == "is_null":
-        return f"Keep records where {field} is null"
-    elif filter_type == "is_not_null":
-        return f"Keep records where {field} is not null"
-    elif filter_type == "between":
-        min_val = config.get("min_value", "")
-        max_val = config.get("max_value", "")
-        return f"Keep records where {field} is between {min_val} and {max_val}"
-    elif filter_type == "in_list":
-        values = config.get("values", [])
-        return f"Keep records where {field} is in [{', '.join(values)}]"
-    else:
-        return f"Filter {field} with {filter_type}"
+    fields = _DescriptionFields(config)
+    if "values" in fields:
+        fields["values"] = ', '.join(fields["values"])
+    
+    template = _FILTER_DESCRIPTIONS.get(fields["filter_type"], "Filter {field} with {filter_type}")
+    return template.format_map(fields)
 
 
 def _get_transform_description(config: Dict[str, Any]) -> str:
     """Generate human-readable description for transform operation."""
-    transform_type = config.get("transform_type", "")
-    
-    if transform_type == "capitalize_field":
-        field = config.get("field", "")
-        return f"Capitalize {field}"
-    elif transform_type == "upper_field":
-        field = config.get("field", "")
-        return f"Convert {field} to uppercase"
-    elif transform_type == "lower_field":
-        field = config.get("field", "")
-        return f"Convert {field} to lowercase"
-    elif transform_type == "strip_field":
-        field = config.get("field", "")
-        return f"Strip whitespace from {field}"
-    elif transform_type == "add_field":
-        field_name = config.get("field_name", "")
-        value = config.get("value", "")
-        return f"Add field '{field_name}' with value '{value}'"
-    elif transform_type == "remove_field":
-        field = config.get("field", "")
-        return f"Remove field {field}"
-    elif transform_type == "rename_field":
-        old_field = config.get("old_field", "")
-        new_field = config.get("new_field", "")
-        return f"Rename {old_field} to {new_field}"
-    elif transform_type == "multiply_field":
-        field = config.get("field", "")
-        value = config.get("value", "")
-        return f"Multiply {field} by {value}"
-    elif transform_type == "add_to_field":
-        field = config.get("field", "")
-        value = config.get("value", "")
-        return f"Add {value} to {field}"
-    elif transform_type == "round_field":
-        field = config.get("field", "")
-        decimals = config.get("decimals", 0)
-        return f"Round {field} to {decimals} decimal places"
-    elif transform_type == "compute_field":
-        field_name = config.get("field_name", "")
-        return f"Compute new field '{field_name}'"
-    else:
-        return f"Transform: {transform_type}"
+    fields = _DescriptionFields({"decimals": 0, **config})
+    
+    template = _TRANSFORM_DESCRIPTIONS.get(fields["transform_type"], "Transform: {transform_type}")
+    return template.format_map(fields)
 
 
 def execute_pipeline(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -389,94 +381,160 @@ def execute_pipeline(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     if not data:
         return []
     
+    pipeline = build_pipeline(get_pipeline_operations())
+    return pipeline.run(data)
+
+
+def build_pipeline(operations: List[Dict[str, Any]]) -> Pipeline:
+    """
+    Build a Pipeline from operation configurations.
+    
+    Pipelines are immutable, so one built for an identical list of
+    operations is reused instead of being rebuilt on every rerun.
+    
+    Args:
+        operations: Pipeline operations as stored in session state
+        
+    Returns:
+        Pipeline applying the operations in order
+    """
+    key = operations_key(operations)
+    if key is None:
+        return _build_pipeline(operations)  # Config not serializable; skip the cache
+    
+    return _build_pipeline_from_key(key)
+
+
+def operations_key(operations: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Serialize operation types and configs into a stable cache key.
+    
+    Returns:
+        JSON key, or None if a config value is not JSON serializable
+    """
+    try:
+        return json.dumps([[op["type"], op["config"]] for op in operations], sort_keys=True)
+    except TypeError:
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _build_pipeline_from_key(key: str) -> Pipeline:
+    """Build (and cache) a pipeline from its serialized operations."""
+    return _build_pipeline([{"type": op_type, "config": config} for op_type, config in json.loads(key)])
+
+
+def _build_pipeline(operations: List[Dict[str, Any]]) -> Pipeline:
+    """Build a pipeline by adding each configured operation in order."""
     pipeline = Pipeline()
-    operations = get_pipeline_operations()
     
     for operation in operations:
-        if operation["type"] == "filter":
-            filter_func = _create_filter_function(operation["config"])
-            pipeline = pipeline.filter(filter_func)
-            
-        elif operation["type"] == "transform":
-            transform_func = _create_transform_function(operation["config"])
-            pipeline = pipeline.map(transform_func)
-            
-        elif operation["type"] == "sort":
-            config = operation["config"]
-            key_func = lambda item: item.get(config["field"])
-            pipeline = pipeline.sort(key_func, config["reverse"])
-            
-        elif operation["type"] == "limit":
-            config = operation["config"]
-            if config["operation"] == "take":
-                pipeline = pipeline.take(config["value"])
-            elif config["operation"] == "skip":
-                pipeline = pipeline.skip(config["value"])
+        add_operation = _OPERATION_BUILDERS.get(operation["type"])
+        if add_operation is not None:
+            pipeline = add_operation(pipeline, operation["config"])
     
-    return pipeline.run(data)
+    return pipeline
+
+
+def _add_filter(pipeline: Pipeline, config: Dict[str, Any]) -> Pipeline:
+    """Add a configured filter operation to the pipeline."""
+    return pipeline.filter(_create_filter_function(config))
+
+
+def _add_transform(pipeline: Pipeline, config: Dict[str, Any]) -> Pipeline:
+    """Add a configured transform operation to the pipeline."""
+    return pipeline.map(_create_transform_function(config))
+
+
+def _add_sort(pipeline: Pipeline, config: Dict[str, Any]) -> Pipeline:
+    """Add a configured sort operation to the pipeline."""
+    # item.get(field) without a Python frame per item
+    key_func = operator.methodcaller("get", config["field"])
+    return pipeline.sort(key_func, config["reverse"])
+
+
+def _add_limit(pipeline: Pipeline, config: Dict[str, Any]) -> Pipeline:
+    """Add a configured take or skip operation to the pipeline."""
+    if config["operation"] == "take":
+        return pipeline.take(config["value"])
+    elif config["operation"] == "skip":
+        return pipeline.skip(config["value"])
+    return pipeline
+
+
+# Builders for each operation type, so adding an operation is one lookup
+_OPERATION_BUILDERS = {
+    "filter": _add_filter,
+    "transform": _add_transform,
+    "sort": _add_sort,
+    "limit": _add_limit,
+}
+
+
+# Filter and transform factories paired with the config keys holding
+# their positional arguments, so building a function is a table lookup.
+_FILTER_FACTORIES = {
+    "equals": (filters.equals, ("field", "value")),
+    "greater_than": (filters.greater_than, ("field", "value")),
+    "greater_than_or_equal": (filters.greater_than_or_equal, ("field", "value")),
+    "less_than": (filters.less_than, ("field", "value")),
+    "less_than_or_equal": (filters.less_than_or_equal, ("field", "value")),
+    "contains": (filters.contains, ("field", "value")),
+    "starts_with": (filters.starts_with, ("field", "value")),
+    "ends_with": (filters.ends_with, ("field", "value")),
+    "is_null": (filters.is_null, ("field",)),
+    "is_not_null": (filters.is_not_null, ("field",)),
+    "between": (filters.between, ("field", "min_value", "max_value")),
+    "in_list": (filters.in_list, ("field", "values")),
+}
+
+_TRANSFORM_FACTORIES = {
+    "capitalize_field": (transforms.capitalize_field, ("field",)),
+    "upper_field": (transforms.upper_field, ("field",)),
+    "lower_field": (transforms.lower_field, ("field",)),
+    "strip_field": (transforms.strip_field, ("field",)),
+    "add_field": (transforms.add_field, ("field_name", "value")),
+    "remove_field": (transforms.remove_field, ("field",)),
+    "rename_field": (transforms.rename_field, ("old_field", "new_field")),
+    "multiply_field": (transforms.multiply_field, ("field", "value")),
+    "add_to_field": (transforms.add_to_field, ("field", "value")),
+    "round_field": (transforms.round_field, ("field", "decimals")),
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_expression(expression: str) -> Callable:
+    """
+    Create a lambda function from a compute_field expression.
+    
+    Cached because the pipeline is rebuilt on every rerun with the same
+    expressions, and compiling them is the costly part.
+    """
+    return eval(f"lambda item: {expression}")
 
 
 def _create_filter_function(config: Dict[str, Any]) -> Callable:
     """Create a filter function from configuration."""
     filter_type = config["filter_type"]
-    field = config["field"]
-    
-    if filter_type == "equals":
-        return filters.equals(field, config["value"])
-    elif filter_type == "greater_than":
-        return filters.greater_than(field, config["value"])
-    elif filter_type == "greater_than_or_equal":
-        return filters.greater_than_or_equal(field, config["value"])
-    elif filter_type == "less_than":
-        return filters.less_than(field, config["value"])
-    elif filter_type == "less_than_or_equal":
-        return filters.less_than_or_equal(field, config["value"])
-    elif filter_type == "contains":
-        return filters.contains(field, config["value"])
-    elif filter_type == "starts_with":
-        return filters.starts_with(field, config["value"])
-    elif filter_type == "ends_with":
-        return filters.ends_with(field, config["value"])
-    elif filter_type == "is_null":
-        return filters.is_null(field)
-    elif filter_type == "is_not_null":
-        return filters.is_not_null(field)
-    elif filter_type == "between":
-        return filters.between(field, config["min_value"], config["max_value"])
-    elif filter_type == "in_list":
-        return filters.in_list(field, config["values"])
-    else:
+    factory_spec = _FILTER_FACTORIES.get(filter_type)
+    
+    if factory_spec is None:
         raise ValueError(f"Unknown filter type: {filter_type}")
+    
+    factory, arg_keys = factory_spec
+    return factory(*[config[key] for key in arg_keys])
 
 
 def _create_transform_function(config: Dict[str, Any]) -> Callable:
     """Create a transform function from configuration."""
     transform_type = config["transform_type"]
+    factory_spec = _TRANSFORM_FACTORIES.get(transform_type)
     
-    if transform_type == "capitalize_field":
-        return transforms.capitalize_field(config["field"])
-    elif transform_type == "upper_field":
-        return transforms.upper_field(config["field"])
-    elif transform_type == "lower_field":
-        return transforms.lower_field(config["field"])
-    elif transform_type == "strip_field":
-        return transforms.strip_field(config["field"])
-    elif transform_type == "add_field":
-        return transforms.add_field(config["field_name"], config["value"])
-    elif transform_type == "remove_field":
-        return transforms.remove_field(config["field"])
-    elif transform_type == "rename_field":
-        return transforms.rename_field(config["old_field"], config["new_field"])
-    elif transform_type == "multiply_field":
-        return transforms.multiply_field(config["field"], config["value"])
-    elif transform_type == "add_to_field":
-        return transforms.add_to_field(config["field"], config["value"])
-    elif transform_type == "round_field":
-        return transforms.round_field(config["field"], config["decimals"])
+    if factory_spec is not None:
+        factory, arg_keys = factory_spec
+        return factory(*[config[key] for key in arg_keys])
     elif transform_type == "compute_field":
-        # Create lambda function from expression
-        expression = config["expression"]
-        func = eval(f"lambda item: {expression}")
+        func = _compile_expression(config["expression"])
         return transforms.compute_field(config["field_name"], func)
     else:
         raise ValueError(f"Unknown transform type: {transform_type}")
@@ -9,11 +9,20 @@ import streamlit as st
 from typing import Dict, List, Any, Optional
 import json
 
+# Number of stage results kept in session state; older runs are evicted first
+_MAX_PIPELINE_RESULTS = 4
+
 
 def initialize_session_state():
     """Initialize session state variables if they don't exist."""
     if 'uploaded_data' not in st.session_state:
         st.session_state.uploaded_data = None
+        st.session_state.data_source = None
+    
+    if 'field_types' not in st.session_state:
+        st.session_state.field_types = {}
+        st.session_state.numeric_fields = []
+        st.session_state.string_fields = []
     
     if 'pipeline_operations' not in st.session_state:
         st.session_state.pipeline_operations = []
@@ -94,8 +103,12 @@ def clear_pipeline_results() -> None:
 
 
 def set_pipeline_results(stage: int, data: List[Dict[str, Any]]) -> None:
-    """Store pipeline results for a specific stage."""
-    st.session_state.pipeline_results[str(stage)] = data
+    """Store pipeline results for a specific stage, evicting the oldest runs."""
+    results = st.session_state.pipeline_results
+    results.pop(str(stage), None)  # Re-insert so the latest run is newest
+    results[str(stage)] = data
+    while len(results) > _MAX_PIPELINE_RESULTS:
+        del results[next(iter(results))]
     st.session_state.processed_data = data
     st.session_state.current_stage = stage
 
@@ -115,12 +128,24 @@ def get_uploaded_data() -> Optional[List[Dict[str, Any]]]:
     return st.session_state.get('uploaded_data')
 
 
-def set_uploaded_data(data: List[Dict[str, Any]]) -> None:
-    """Set uploaded data and clear pipeline."""
+def set_uploaded_data(data: List[Dict[str, Any]], source: Optional[str] = None) -> None:
+    """Set uploaded data and its source identifier (e.g. content hash), and clear pipeline."""
     st.session_state.uploaded_data = data
+    st.session_state.data_source = source
+    field_types = _infer_field_types(data)
+    st.session_state.field_types = field_types
+    st.session_state.numeric_fields = [field for field, type_name in field_types.items()
+                                       if type_name in ('int', 'float')]
+    st.session_state.string_fields = [field for field, type_name in field_types.items()
+                                      if type_name == 'str']
     clear_pipeline()
 
 
+def get_data_source() -> Optional[str]:
+    """Get the identifier of the currently loaded data, if any."""
+    return st.session_state.get('data_source')
+
+
 def get_field_names() -> List[str]:
     """Get field names from uploaded data."""
     data = get_uploaded_data()
@@ -130,9 +155,13 @@ def get_field_names() -> List[str]:
 
 
 def get_field_types() -> Dict[str, str]:
-    """Get field types from uploaded data."""
-    data = get_uploaded_data()
-    if not data or len(data) == 0:
+    """Get field types from uploaded data (computed once per upload)."""
+    return st.session_state.get('field_types', {})
+
+
+def _infer_field_types(data: Optional[List[Dict[str, Any]]]) -> Dict[str, str]:
+    """Infer field types from the first occurrence of each field."""
+    if not data:
         return {}
     
     field_types = {}
@@ -144,14 +173,10 @@ def get_field_types() -> Dict[str, str]:
 
 
 def get_numeric_fields() -> List[str]:
-    """Get list of numeric field names."""
-    field_types = get_field_types()
-    return [field for field, type_name in field_types.items() 
-            if type_name in ['int', 'float']]
+    """Get list of numeric field names (computed once per upload)."""
+    return st.session_state.get('numeric_fields', [])
 
 
 def get_string_fields() -> List[str]:
-    """Get list of string field names."""
-    field_types = get_field_types()
-    return [field for field, type_name in field_types.items() 
-            if type_name == 'str']
+    """Get list of string field names (computed once per upload)."""
+    return st.session_state.get('string_fields', [])
@@ -5,8 +5,6 @@ Run this to verify the installation works correctly.
 """
 
 import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
 
 def test_imports():
     """Test that all modules import correctly."""
@@ -2,8 +2,12 @@
 Tests for funcpipe pipeline functionality.
 """
 
+import json
+import math
+import os
+import tempfile
 import unittest
-from funcpipe import Pipeline, filters, transforms
+from funcpipe import Pipeline, filters, transforms, readers, writers
 
 
 class TestPipeline(unittest.TestCase):
@@ -83,6 +87,39 @@ class TestPipeline(unittest.TestCase):
         self.assertEqual(result[0]['name'], 'bob')  # Second item
         self.assertEqual(result[1]['name'], 'Charlie')  # Third item
     
+    def test_adjacent_filters(self):
+        """Test chained filters are applied in order and keep pipeline length."""
+        seen = []
+        
+        def track(item):
+            seen.append(item['name'])
+            return True
+        
+        pipeline = (Pipeline()
+                   .filter(filters.greater_than('age', 27))
+                   .filter(track)
+                   .filter(filters.less_than('salary', 55000)))
+        
+        result = pipeline.run(self.sample_data)
+        
+        self.assertEqual(len(pipeline), 3)
+        self.assertEqual([item['name'] for item in result], ['Alice', 'diana'])
+        self.assertEqual(seen, ['Alice', 'Charlie', 'diana'])  # Only items passing age filter
+    
+    def test_adjacent_maps(self):
+        """Test chained maps are applied in order and keep pipeline length."""
+        pipeline = (Pipeline()
+                   .map(transforms.multiply_field('salary', 2))
+                   .map(transforms.add_to_field('salary', 1))
+                   .filter(filters.greater_than('salary', 100000))
+                   .map(transforms.upper_field('name')))
+        
+        result = pipeline.run(self.sample_data)
+        
+        self.assertEqual(len(pipeline), 4)
+        self.assertEqual([item['salary'] for item in result], [100001, 120001, 104001])
+        self.assertEqual([item['name'] for item in result], ['ALICE', 'CHARLIE', 'DIANA'])
+    
     def test_immutability(self):
         """Test that operations don't modify original data."""
         original_data = self.sample_data.copy()
@@ -98,6 +135,31 @@ class TestPipeline(unittest.TestCase):
         # Result should be modified
         self.assertNotEqual(result, original_data)
         self.assertTrue(all(item['name'].isupper() for item in result))
+    
+    def test_branching_pipelines(self):
+        """Test that extending a pipeline leaves the original unchanged."""
+        base = Pipeline().filter(filters.greater_than('age', 25))
+        extended = base.take(1)
+        
+        self.assertEqual(len(base), 1)
+        self.assertEqual(len(extended), 2)
+        self.assertEqual(len(base.run(self.sample_data)), 3)
+    
+    def test_iterator_input(self):
+        """Test that pipelines accept lazy input and stop reading early on take."""
+        records = iter(self.sample_data)
+        
+        result = Pipeline().skip(1).run(iter(self.sample_data))
+        self.assertEqual([item['name'] for item in result], ['bob', 'Charlie', 'diana'])
+        
+        result = Pipeline().take(2).run(records)
+        self.assertEqual(len(result), 2)
+        self.assertEqual(next(records)['name'], 'Charlie')
+        
+        self.assertEqual(Pipeline().run(iter(self.sample_data)), self.sample_data)
+        
+        for pipeline in (Pipeline().take(-1), Pipeline().skip(-1)):
+            self.assertEqual(pipeline.run(iter(self.sample_data)), pipeline.run(self.sample_data))
 
 
 class TestFilters(unittest.TestCase):
@@ -138,6 +200,13 @@ class TestFilters(unittest.TestCase):
         self.assertTrue(filters.is_not_null('name')(item))
         self.assertFalse(filters.is_not_null('middle_name')(item))
     
+    def test_between_filter(self):
+        """Test inclusive and exclusive range filters."""
+        self.assertTrue(filters.between('age', 30, 40)({"age": 30}))
+        self.assertFalse(filters.between('age', 30, 40, inclusive=False)({"age": 30}))
+        self.assertTrue(filters.between('age', 30, 40, inclusive=False)({"age": 35}))
+        self.assertFalse(filters.between('age', 30, 40)({"age": None}))
+    
     def test_combined_filters(self):
         """Test combining filters with and/or."""
         item = {"name": "Alice", "age": 30, "active": True}
@@ -193,6 +262,40 @@ class TestTransforms(unittest.TestCase):
         result = transforms.round_field('value', 2)(item_with_decimal)
         self.assertEqual(result['value'], 3.14)
     
+    def test_replace_in_field(self):
+        """Test case-sensitive and case-insensitive replacement."""
+        item = {"title": "Hello World, hello"}
+        
+        result = transforms.replace_in_field('title', 'hello', 'bye')(item)
+        self.assertEqual(result['title'], 'Hello World, bye')
+        
+        result = transforms.replace_in_field('title', 'hello', 'bye', case_sensitive=False)(item)
+        self.assertEqual(result['title'], 'bye World, bye')
+    
+    def test_cast_field(self):
+        """Test casting fields, including values already of the target type."""
+        to_int = transforms.cast_field('age', int)
+        
+        self.assertEqual(to_int({"age": "30"}), {"age": 30})
+        self.assertEqual(to_int({"age": 30}), {"age": 30})
+        self.assertIs(type(to_int({"age": True})['age']), int)  # bool is not int
+        self.assertEqual(to_int({"age": "n/a"}), {"age": "n/a"})  # Failed cast keeps value
+        
+        item = {"tags": ["a"]}
+        transforms.cast_field('tags', list)(item)['tags'].append("b")
+        self.assertEqual(item, {"tags": ["a"]})  # Containers are copied, not shared
+    
+    def test_transforms_do_not_modify_input(self):
+        """Test transforms return new records and leave the input unchanged."""
+        item = {"name": " alice ", "tags": ["a"]}
+        
+        stripped = transforms.strip_field('name')(item)
+        computed = transforms.compute_field('count', lambda r: r['tags'].append('b') or len(r['tags']))(item)
+        
+        self.assertEqual(stripped['name'], 'alice')
+        self.assertEqual(computed['count'], 2)
+        self.assertEqual(item, {"name": " alice ", "tags": ["a"]})
+    
     def test_computed_fields(self):
         """Test computed field transformation."""
         item = {"first_name": "Alice", "last_name": "Johnson", "age": 30}
@@ -207,5 +310,92 @@ class TestTransforms(unittest.TestCase):
         self.assertIn('first_name', result)  # Original fields preserved
 
 
+class TestReadersWriters(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+    
+    def test_json_round_trip(self):
+        """Test writing and reading back JSON data."""
+        data = [{"name": "Zoë", "score": 85.5, "tags": ["a", "b"]}, {"name": "Bob", "score": None}]
+        filepath = os.path.join(self.tmp_dir.name, "out.json")
+        
+        writers.write_json(data, filepath)
+        
+        self.assertEqual(readers.read_json(filepath), data)
+        with open(filepath, encoding='utf-8') as f:
+            self.assertIn('"Zoë"', f.read())  # Non-ASCII written as-is
+    
+    def test_json_non_finite_round_trip(self):
+        """Test NaN and infinity survive writing and reading back JSON."""
+        filepath = os.path.join(self.tmp_dir.name, "nan.json")
+        
+        writers.write_json([{"score": float('nan'), "limit": float('inf')}], filepath)
+        
+        record = readers.read_json(filepath)[0]
+        self.assertTrue(math.isnan(record["score"]))
+        self.assertEqual(record["limit"], float('inf'))
+    
+    def test_json_output_matches_standard_library(self):
+        """Test JSON output is the same whether or not orjson is installed."""
+        data = [{"small": 0.00001, "large": 1e16, "score": 85.5, "zero": -0.0}]
+        
+        expected = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        self.assertEqual(writers.dumps_json(data), expected)
+    
+    def test_read_json_wide_integers(self):
+        """Test integers wider than 64 bits are read back exactly."""
+        filepath = os.path.join(self.tmp_dir.name, "big.json")
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write('[{"id": 123456789012345678901234567890, "score": 1.5}]')
+        
+        self.assertEqual(readers.read_json(filepath), [{"id": 123456789012345678901234567890, "score": 1.5}])
+    
+    def test_write_creates_missing_directory(self):
+        """Test writers create the parent directory when it does not exist."""
+        filepath = os.path.join(self.tmp_dir.name, "nested", "dir", "out.csv")
+        
+        writers.write_csv([{"a": 1}], filepath)
+        
+        self.assertEqual(readers.read_csv(filepath), [{"a": 1}])
+    
+    def test_csv_numeric_conversion(self):
+        """Test CSV values are converted to numbers where possible."""
+        filepath = os.path.join(self.tmp_dir.name, "in.csv")
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write("name,age,score,code\nAlice,30,85.5,-7\nBob, 25 ,inf,x1\n")
+        
+        data = readers.read_csv(filepath)
+        
+        self.assertEqual(data[0], {"name": "Alice", "age": 30, "score": 85.5, "code": -7})
+        self.assertEqual(data[1], {"name": "Bob", "age": 25, "score": float('inf'), "code": "x1"})
+    
+    def test_read_sample(self):
+        """Test sampling and lazily iterating CSV records."""
+        filepath = os.path.join(self.tmp_dir.name, "in.csv")
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write("id\n1\n2\n3\n")
+        
+        records = readers.iter_records(filepath)
+        
+        self.assertEqual(readers.read_sample(filepath, 2), [{"id": 1}, {"id": 2}])
+        self.assertEqual(readers.read_sample(filepath, -1), [{"id": 1}, {"id": 2}])
+        self.assertEqual(next(records), {"id": 1})
+        records.close()
+    
+    def test_get_file_info(self):
+        """Test file info reports fields and record count."""
+        filepath = os.path.join(self.tmp_dir.name, "in.json")
+        writers.write_json([{"a": 1, "b": 2}, {"a": 3, "b": 4}], filepath)
+        
+        info = readers.get_file_info(filepath)
+        
+        self.assertEqual(info['fields'], ['a', 'b'])
+        self.assertEqual(info['record_count'], 2)
+
+
 if __name__ == '__main__':
     unittest.main()